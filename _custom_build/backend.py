@@ -9,14 +9,23 @@ import sys
 
 import setuptools.build_meta
 
+#: Values interpreted as true for boolean options
+TRUE_VALUES = frozenset({"1", "true", "yes", "on", "y"})
 
-def usage(args: dict[str, str | list[str] | None]) -> argparse.Namespace:
-    """Parse the command line arguments.
+#: Options forwarded as is to the build_ext command
+OPTIONS = (
+    ("cmake_args", "--cmake-args"),
+    ("cxx_compiler", "--cxx-compiler"),
+    ("generator", "--generator"),
+    ("mkl_root", "--mkl-root"),
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Create the parser of the command line arguments.
 
-    Args:
-        args: Dictionary of arguments to parse.
     Returns:
-        Parsed arguments.
+        The argument parser.
     """
     parser = argparse.ArgumentParser("Custom build backend")
     parser.add_argument(
@@ -39,7 +48,22 @@ def usage(args: dict[str, str | list[str] | None]) -> argparse.Namespace:
         "--mkl",
         help="Use MKL as the BLAS library",
     )
-    return parser.parse_args(args=[f"--{k}={v}" for k, v in args.items()])
+    return parser
+
+
+#: Parser of the command line arguments, the option set being static
+PARSER = _build_parser()
+
+
+def usage(args: dict[str, str | list[str] | None]) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Args:
+        args: Dictionary of arguments to parse.
+    Returns:
+        Parsed arguments.
+    """
+    return PARSER.parse_args(args=[f"--{k}={v}" for k, v in args.items()])
 
 
 def decode_bool(value: str | None) -> bool:
@@ -50,10 +74,7 @@ def decode_bool(value: str | None) -> bool:
     Returns:
         bool: The decoded boolean value.
     """
-    result = False
-    if value is not None:
-        result = value.lower() in {"1", "true", "yes"}
-    return result
+    return value is not None and value.lower() in TRUE_VALUES
 
 
 class _CustomBuildMetaBackend(setuptools.build_meta._BuildMetaBackend):
@@ -71,15 +92,11 @@ class _CustomBuildMetaBackend(setuptools.build_meta._BuildMetaBackend):
             setup_script: The path to the setup script.
         """
         args = usage(self.config_settings or {})  # type: ignore[arg-type]
-        setuptools_args = []
-        if args.cmake_args:
-            setuptools_args.append(f"--cmake-args={args.cmake_args}")
-        if args.cxx_compiler:
-            setuptools_args.append(f"--cxx-compiler={args.cxx_compiler}")
-        if args.generator:
-            setuptools_args.append(f"--generator={args.generator}")
-        if args.mkl_root:
-            setuptools_args.append(f"--mkl-root={args.mkl_root}")
+        setuptools_args = [
+            f"{option}={value}"
+            for attr, option in OPTIONS
+            if (value := getattr(args, attr))
+        ]
         if decode_bool(args.mkl):
             setuptools_args.append("--mkl=yes")
 
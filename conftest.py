@@ -2,6 +2,7 @@
 #
 # This software is distributed by the CNES under a proprietary license.
 # It is not public and cannot be redistributed or used without permission.
+import functools
 import os
 import pathlib
 import sys
@@ -16,7 +17,11 @@ MINOR = sys.version_info[1]
 # Working directory
 WORKING_DIRECTORY = pathlib.Path(__file__).parent.absolute()
 
+# True once the build directory has been added to sys.path
+_PUSHED = False
 
+
+@functools.lru_cache(maxsize=None)
 def build_dirname(extname=None):
     """Returns the name of the build directory."""
     extname = "" if extname is None else os.sep.join(extname.split(".")[:-1])
@@ -38,6 +43,10 @@ def build_dirname(extname=None):
 
 def push_front_syspath():
     """Add the build directory to the front of sys.path."""
+    global _PUSHED  # noqa: PLW0603
+    if _PUSHED:
+        return
+    _PUSHED = True
     if WORKING_DIRECTORY.joinpath("setup.py").exists():
         # We are in the root directory of the development tree
         sys.path.insert(0, str(build_dirname().resolve()))
@@ -5,12 +5,9 @@
 
 namespace perth {
 
-/// @brief Compute the frequency of a tide with a given Doodson number
-/// (without the 5's). The returned frequency is in units of degrees per hour.
-/// @param[in] doodson_number Doodson number as a 6-dimensional vector.
-/// @return Frequency in degrees per hour.
-inline auto tidal_frequency(const Eigen::Ref<const Vector6d> &doodson_number)
-    -> double {
+/// @brief Compute the rates of change of the Doodson arguments.
+/// @return Rates in degrees per hour.
+inline auto doodson_rates() -> Vector6d {
   // Time interval in days
   constexpr double del = 0.05;
 
@@ -23,10 +20,29 @@ inline auto tidal_frequency(const Eigen::Ref<const Vector6d> &doodson_number)
   const auto beta2 = calculate_celestial_vector(t2, 0.0);
 
   // Compute rates in degrees per hour
-  const auto rates = (beta2 - beta1) / (24.0 * del);
+  return (beta2 - beta1) / (24.0 * del);
+}
 
+/// @brief Compute the frequency of a tide with a given Doodson number
+/// (without the 5's). The returned frequency is in units of degrees per hour.
+/// @param[in] doodson_number Doodson number as a 6-dimensional vector.
+/// @return Frequency in degrees per hour.
+inline auto tidal_frequency(const Eigen::Ref<const Vector6d> &doodson_number)
+    -> double {
   // Compute frequency as dot product with Doodson number
-  return rates.dot(doodson_number);
+  return doodson_rates().dot(doodson_number);
+}
+
+/// @brief Compute the frequencies of several tides with given Doodson numbers
+/// (without the 5's). The returned frequencies are in units of degrees per
+/// hour.
+/// @param[in] doodson_numbers Doodson numbers, one per row.
+/// @return Frequencies in degrees per hour.
+inline auto tidal_frequencies(
+    const Eigen::Ref<const Eigen::Matrix<double, -1, 6, Eigen::RowMajor>>
+        &doodson_numbers) -> Eigen::VectorXd {
+  // The rates are computed once for all the Doodson numbers
+  return doodson_numbers * doodson_rates();
 }
 
 }  // namespace perth
@@ -16,6 +16,7 @@
 #include "perth/grid.hpp"
 #include "perth/math.hpp"
 #include "perth/nodal_corrections.hpp"
+#include "perth/parallel_for.hpp"
 
 namespace perth {
 
@@ -136,35 +137,54 @@ class TidalModel : public std::enable_shared_from_this<TidalModel<T>> {
       const Eigen::Ref<
           const Eigen::Matrix<std::complex<T>, -1, -1, Eigen::RowMajor>>& wave)
       -> void {
-    auto row_major = wave.rows() == lon_.size() && wave.cols() == lat_.size();
-    if (row_major != row_major_) {
-      throw std::invalid_argument(
-          "The data is not in the expected row-major order: expected " +
-          std::string(row_major_ ? "true" : "false") + ", got " +
-          std::string(row_major ? "true" : "false"));
-    }
-    if (row_major) {
-      if (wave.rows() != lon_.size() || wave.cols() != lat_.size()) {
-        throw std::invalid_argument(
-            "The data size does not match the axes size: expected (" +
-            std::to_string(lon_.size()) + "x" + std::to_string(lat_.size()) +
-            "), got (" + std::to_string(wave.rows()) + "x" +
-            std::to_string(wave.cols()) + ")");
-      }
-    } else {
-      if (wave.rows() != lat_.size() || wave.cols() != lon_.size()) {
-        throw std::invalid_argument(
-            "The data size does not match the axes size: expected (" +
-            std::to_string(lat_.size()) + "x" + std::to_string(lon_.size()) +
-            "), got (" + std::to_string(wave.rows()) + "x" +
-            std::to_string(wave.cols()) + ")");
-      }
-    }
+    check_shape(wave.rows(), wave.cols());
     this->data_.emplace(ident,
                         Eigen::Map<const Eigen::Vector<std::complex<T>, -1>>(
                             wave.data(), wave.size()));
   }
 
+  /// @brief Add a tidal constituent from its amplitude and phase.
+  ///
+  /// The wave `amp_scale * amp * exp(i * ph_scale * ph)` is built directly
+  /// into the storage of the model, without intermediate arrays.
+  /// @param ident Constituent identifier.
+  /// @param amp Amplitude of the constituent.
+  /// @param ph Phase of the constituent.
+  /// @param amp_scale Factor converting the amplitude to meters.
+  /// @param ph_scale Factor converting the phase to radians.
+  /// @param num_threads Number of threads to use. If 0, all CPUs are used.
+  inline auto add_constituent_polar(
+      const Constituent ident,
+      const Eigen::Ref<const Eigen::Matrix<T, -1, -1, Eigen::RowMajor>>& amp,
+      const Eigen::Ref<const Eigen::Matrix<T, -1, -1, Eigen::RowMajor>>& ph,
+      const T amp_scale, const T ph_scale, const size_t num_threads = 0)
+      -> void {
+    if (amp.rows() != ph.rows() || amp.cols() != ph.cols()) {
+      throw std::invalid_argument(
+          "The amplitude and phase must have the same shape: got (" +
+          std::to_string(amp.rows()) + "x" + std::to_string(amp.cols()) +
+          ") and (" + std::to_string(ph.rows()) + "x" +
+          std::to_string(ph.cols()) + ")");
+    }
+    check_shape(amp.rows(), amp.cols());
+
+    auto wave = Eigen::Vector<std::complex<T>, -1>(amp.size());
+    const auto cols = amp.cols();
+    auto worker = [&](const size_t start, const size_t end) -> void {
+      for (auto ix = static_cast<Eigen::Index>(start);
+           ix < static_cast<Eigen::Index>(end); ++ix) {
+        for (Eigen::Index jx = 0; jx < cols; ++jx) {
+          const auto a = amp_scale * amp(ix, jx);
+          const auto p = ph_scale * ph(ix, jx);
+          wave(ix * cols + jx) =
+              std::complex<T>(a * std::cos(p), a * std::sin(p));
+        }
+      }
+    };
+    parallel_for(worker, static_cast<size_t>(amp.rows()), num_threads);
+    this->data_.emplace(ident, std::move(wave));
+  }
+
   inline auto interpolate(const double lon, const double lat,
                           ConstituentTable& constituent_table,
                           Accelerator* acc) const -> Quality {
@@ -203,6 +223,35 @@ class TidalModel : public std::enable_shared_from_this<TidalModel<T>> {
 
   auto interpolate(const double lon, const double lat, Quality& quality,
                    Accelerator* acc) const -> const ConstituentValues&;
+
+  /// Check that a grid of the given shape matches the axes of the model.
+  auto check_shape(const Eigen::Index rows, const Eigen::Index cols) const
+      -> void {
+    auto row_major = rows == lon_.size() && cols == lat_.size();
+    if (row_major != row_major_) {
+      throw std::invalid_argument(
+          "The data is not in the expected row-major order: expected " +
+          std::string(row_major_ ? "true" : "false") + ", got " +
+          std::string(row_major ? "true" : "false"));
+    }
+    if (row_major) {
+      if (rows != lon_.size() || cols != lat_.size()) {
+        throw std::invalid_argument(
+            "The data size does not match the axes size: expected (" +
+            std::to_string(lon_.size()) + "x" + std::to_string(lat_.size()) +
+            "), got (" + std::to_string(rows) + "x" + std::to_string(cols) +
+            ")");
+      }
+    } else {
+      if (rows != lat_.size() || cols != lon_.size()) {
+        throw std::invalid_argument(
+            "The data size does not match the axes size: expected (" +
+            std::to_string(lat_.size()) + "x" + std::to_string(lon_.size()) +
+            "), got (" + std::to_string(rows) + "x" + std::to_string(cols) +
+            ")");
+      }
+    }
+  }
 };
 
 template <typename T>
@@ -1,6 +1,9 @@
 from perth import _core
+import functools
 import numpy
+import operator
 import pathlib
+import re
 
 ROOT = pathlib.Path(__file__).parent.parent
 
@@ -27,17 +30,27 @@ GREEK_LETTERS = {
     "Tau": "\\tau",
 }
 
+#: Matches any of the greek letters in a single scan of the name
+GREEK_PATTERN = re.compile("|".join(re.escape(item) for item in GREEK_LETTERS))
 
+#: Name of the constituents, cached to avoid repeated calls to the C++ core
+_constituent_to_name = functools.lru_cache(maxsize=256)(
+    _core.constituent_to_name
+)
+
+
+@functools.lru_cache(maxsize=256)
 def _pretty_name(name: str) -> str:
     """
     Convert the greek letter in the name to its LaTeX representation.
     If the name does not contain a greek letter, return it unchanged.
     """
-    for greek, latex in GREEK_LETTERS.items():
-        if greek in name:
-            value = name[-1]
-            return f"{name} (${latex} {value}$)"
-    return name
+    match = GREEK_PATTERN.search(name)
+    if match is None:
+        return name
+    latex = GREEK_LETTERS[match.group(0)]
+    value = name[-1]
+    return f"{name} (${latex} {value}$)"
 
 
 def to_xdo(numbers: numpy.ndarray):
@@ -55,21 +68,29 @@ def create_constituent_representation() -> str:
         "| --- | --- | --- |",
     ]
 
-    data = {}
-    for constituent in table:
-        component = table[constituent]
-        name = _pretty_name(_core.constituent_to_name(constituent))
-        frequency = _core.tidal_frequency(component.doodson_number[:6])
-        xdo = to_xdo(component.doodson_number)
-        data[constituent.name] = {
-            "speed": frequency,
-            "name": name,
-            "xdo": xdo,
-        }
+    constituents = list(table)
+    doodson_numbers = numpy.asarray(
+        [table[constituent].doodson_number for constituent in constituents],
+        dtype=numpy.int8,
+    )
+    frequencies = _core.tidal_frequencies(doodson_numbers[:, :6])
+
+    rows = [
+        (
+            frequency,
+            _pretty_name(_constituent_to_name(constituent)),
+            to_xdo(numbers),
+        )
+        for constituent, numbers, frequency in zip(
+            constituents, doodson_numbers, frequencies, strict=True
+        )
+    ]
+    # Sort on the speed only: the sort is stable, so constituents sharing the
+    # same speed keep the order of the table.
+    rows.sort(key=operator.itemgetter(0))
 
     lines.extend(
-        f"| {values['name']} | {values['speed']:.7f}  | {values['xdo']} |"
-        for values in sorted(data.values(), key=lambda item: item["speed"])
+        f"| {name} | {speed:.7f}  | {xdo} |" for speed, name, xdo in rows
     )
     return "\n".join(lines)
 
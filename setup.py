@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Setup script for the PERTH library."""
 
+import functools
+import hashlib
 import os
 import pathlib
 import platform
 import re
+import shutil
 import sys
 import sysconfig
 import warnings
@@ -15,6 +18,9 @@ import setuptools.command.build_ext
 # Working directory
 WORKING_DIRECTORY = pathlib.Path(__file__).parent.absolute()
 
+# Operating system running the build
+SYSTEM = platform.system()
+
 # OSX deployment target
 OSX_DEPLOYMENT_TARGET = "10.14"
 
@@ -24,6 +30,9 @@ PY_VERSION = WORKING_DIRECTORY / "src" / "perth" / "version.py"
 # C++ version file
 CXX_VERSION = WORKING_DIRECTORY / "include" / "perth" / "version.hpp"
 
+# File storing the digest of the arguments used to configure CMake
+CMAKE_ARGS_DIGEST = ".perth_cmake_args.sha256"
+
 # Git empty tree SHA - represents the state before any commits exist
 # This is the SHA-1 hash of an empty git tree object, used as a baseline
 # when no previous tags exist for computing file differences
@@ -55,16 +64,24 @@ def distutils_dirname(prefix=None, extname=None) -> pathlib.Path:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def fetch_package_version() -> str:
+    # Make sure that the working directory is the root of the project,
+    # otherwise setuptools_scm will not be able to find the version number.
+    os.chdir(WORKING_DIRECTORY)
+
+    # A version set in the environment bypasses setuptools_scm and the git
+    # commands it runs.
+    for name in ("SETUPTOOLS_SCM_PRETEND_VERSION", "PERTH_VERSION"):
+        if os.environ.get(name):
+            return os.environ[name]
+
     if not (WORKING_DIRECTORY / ".git").exists():
         with PY_VERSION.open() as stream:
             for line in stream:
                 if line.startswith("__version__"):
                     return line.split("=")[1].strip()[1:-1]
 
-    # Make sure that the working directory is the root of the project,
-    # otherwise setuptools_scm will not be able to find the version number.
-    os.chdir(WORKING_DIRECTORY)
     import setuptools_scm
 
     try:
@@ -78,6 +95,17 @@ def fetch_package_version() -> str:
         return "0.0.0"
 
 
+def write_if_changed(path: pathlib.Path, content: str) -> None:
+    """Write the content to the file only if it differs from the existing one.
+
+    Leaving an up-to-date file untouched preserves its modification time, so
+    CMake and ccache do not rebuild the sources that depend on it.
+    """
+    if path.exists() and path.read_text() == content:
+        return
+    path.write_text(content)
+
+
 def update_version_library(release: str) -> None:
     """Update the version of the library."""
     if not (WORKING_DIRECTORY / ".git").exists():
@@ -94,12 +122,6 @@ def update_version_library(release: str) -> None:
     if dev is None:
         dev = ""
 
-    if CXX_VERSION.exists():
-        with CXX_VERSION.open() as stream:
-            existing = "".join(stream.read())
-    else:
-        existing = ""
-
     new = f"""/// @file perth/version.hpp
 /// @brief Version of the library
 #pragma once
@@ -110,15 +132,7 @@ def update_version_library(release: str) -> None:
 /// Patch version of the library
 #define PERTH_VERSION_PATCH {patch}{dev}
 """
-    if existing != "".join(new):
-        with CXX_VERSION.open("w") as stream:
-            stream.write(new)
-
-    if PY_VERSION.exists():
-        with PY_VERSION.open() as stream:
-            existing = "".join(stream.read())
-    else:
-        existing = ""
+    write_if_changed(CXX_VERSION, new)
 
     new = f'''
 # Copyright (c) 2025 CNES
@@ -131,9 +145,7 @@ Get software version information
 """
 __version__ = "{release}"
 '''
-    if existing != "".join(new):
-        with PY_VERSION.open("w") as stream:
-            stream.write(new)
+    write_if_changed(PY_VERSION, new)
 
 
 # pylint: disable=too-few-public-methods
@@ -248,10 +260,29 @@ class BuildExt(setuptools.command.build_ext.build_ext):
             return os.environ["CONDA_PREFIX"]
         return None
 
+    @staticmethod
+    def compiler_launcher() -> str | None:
+        """Returns the compiler launcher (ccache or sccache) if available."""
+        return shutil.which("ccache") or shutil.which("sccache")
+
     def set_cmake_user_options(self) -> list[str]:
         """Set the CMake user options."""
         result: list[str] = []
 
+        launcher = self.compiler_launcher()
+        if launcher is not None:
+            # Make the cache independent of the temporary directory used to
+            # build the wheel, otherwise every build misses the cache.
+            os.environ.setdefault("CCACHE_BASEDIR", str(WORKING_DIRECTORY))
+            os.environ.setdefault(
+                "CCACHE_SLOPPINESS",
+                "pch_defines,time_macros,include_file_mtime",
+            )
+            result += [
+                "-DCMAKE_C_COMPILER_LAUNCHER=" + launcher,
+                "-DCMAKE_CXX_COMPILER_LAUNCHER=" + launcher,
+            ]
+
         if self.cxx_compiler is not None:
             result.append("-DCMAKE_CXX_COMPILER=" + self.cxx_compiler)
 
@@ -295,19 +326,37 @@ class BuildExt(setuptools.command.build_ext.build_ext):
         ]
         build_args = ["--config", cfg]
 
-        is_windows = platform.system() == "Windows"
+        is_windows = SYSTEM == "Windows"
+
+        # sccache cannot intercept cl.exe with the Visual Studio generator,
+        # so Ninja is used by default when a compiler launcher is available,
+        # provided that Ninja is installed and that the MSVC developer
+        # environment, which Ninja needs to find cl.exe, is active.
+        use_ninja = (
+            is_windows
+            and self.generator is None
+            and self.compiler_launcher() is not None
+            and shutil.which("ninja") is not None
+            and "VCINSTALLDIR" in os.environ
+        )
 
         if self.generator is not None:
             cmake_args.append("-G" + self.generator)
+        elif use_ninja:
+            cmake_args.append("-G" + "Ninja")
         elif is_windows:
             cmake_args.append("-G" + "Visual Studio 17 2022")
 
         if not is_windows:
             build_args += ["--", f"-j{os.cpu_count()}"]
-            if platform.system() == "Darwin":
+            if SYSTEM == "Darwin":
                 cmake_args += [
                     f"-DCMAKE_OSX_DEPLOYMENT_TARGET={OSX_DEPLOYMENT_TARGET}",
                 ]
+        elif use_ninja:
+            cmake_args += [
+                f"-DCMAKE_LIBRARY_OUTPUT_DIRECTORY_{cfg.upper()}={extdir}",
+            ]
         else:
             cmake_args += [
                 "-DCMAKE_GENERATOR_PLATFORM=x64",
@@ -315,39 +364,57 @@ class BuildExt(setuptools.command.build_ext.build_ext):
             ]
             build_args += ["--", "/m"]
 
-        os.chdir(str(build_temp))
-
-        # Configure CMake if needed or requested
+        # Configure CMake if needed, requested, or if the arguments used to
+        # configure the project have changed since the last run.
+        digest = hashlib.sha256("\n".join(cmake_args).encode()).hexdigest()
+        digest_path = pathlib.Path(build_temp, CMAKE_ARGS_DIGEST)
         configure = (
-            (self.reconfigure is not None)
-            if pathlib.Path(
+            self.reconfigure is not None
+            or not pathlib.Path(
                 build_temp,
                 "CMakeFiles",
                 "TargetDirectories.txt",
             ).exists()
-            else True
+            or not digest_path.exists()
+            or digest_path.read_text() != digest
         )
 
         if configure:
-            self.spawn(["cmake", str(WORKING_DIRECTORY), *cmake_args])
+            self.spawn(
+                [
+                    "cmake",
+                    "-S",
+                    str(WORKING_DIRECTORY),
+                    "-B",
+                    str(build_temp),
+                    *cmake_args,
+                ]
+            )
+            if not self.dry_run:
+                digest_path.write_text(digest)
         if not self.dry_run:
             target = [item.name.split(".")[-1] for item in ext]
-            cmake_cmd = ["cmake", "--build", ".", "--target", *target]
+            cmake_cmd = [
+                "cmake",
+                "--build",
+                str(build_temp),
+                "--target",
+                *target,
+            ]
             self.spawn(cmake_cmd + build_args)
-        os.chdir(str(WORKING_DIRECTORY))
 
     # pylint: enable=too-many-instance-attributes
 
 
 def typehints() -> list[tuple[str, list[str]]]:
     """Get the list of type information files."""
-    pyi = []
-    for root, _, files in os.walk(WORKING_DIRECTORY):
-        pyi += [
-            str(pathlib.Path(root, item).relative_to(WORKING_DIRECTORY))
-            for item in files
-            if item.endswith(".pyi")
-        ]
+    # Type stubs only live in the package sources, scanning the whole tree
+    # would also walk the build directories.
+    package = WORKING_DIRECTORY / "src" / "perth"
+    pyi = [
+        str(item.relative_to(WORKING_DIRECTORY))
+        for item in sorted(package.rglob("*.pyi"))
+    ]
     return [
         (
             str(
@@ -385,6 +452,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    if platform.system() == "Darwin":
+    if SYSTEM == "Darwin":
         os.environ["MACOSX_DEPLOYMENT_TARGET"] = OSX_DEPLOYMENT_TARGET
     main()
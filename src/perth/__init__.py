@@ -1,6 +1,6 @@
-from typing import Annotated, TypeAlias
-from numpy.typing import NDArray
-import numpy
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated, Any, TypeAlias
 
 from ._core import (
     Constituent,
@@ -13,11 +13,15 @@ from ._core import (
     TidalModelFloat64,
 )
 
-from .model import load_model
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    import numpy
+
+    from .model import load_model
 
-VectorDateTime64: TypeAlias = Annotated[NDArray[numpy.datetime64], "[m, 1]"]
-VectorFloat64: TypeAlias = Annotated[NDArray[numpy.float64], "[m, 1]"]
-VectorInt8: TypeAlias = Annotated[NDArray[numpy.int8], "[m, 1]"]
+VectorDateTime64: TypeAlias = Annotated["NDArray[numpy.datetime64]", "[m, 1]"]
+VectorFloat64: TypeAlias = Annotated["NDArray[numpy.float64]", "[m, 1]"]
+VectorInt8: TypeAlias = Annotated["NDArray[numpy.int8]", "[m, 1]"]
 
 LINEAR_ADMITTANCE: InterpolationType = InterpolationType.LINEAR_ADMITTANCE
 FOURIER_ADMITTANCE: InterpolationType = InterpolationType.FOURIER_ADMITTANCE
@@ -45,6 +49,54 @@ __all__ = [
 ]
 
 
+#: Handler implementing the evaluation for each type of tidal model
+_HANDLERS: dict[type, type[PerthFloat32 | PerthFloat64]] = {
+    TidalModelFloat32: PerthFloat32,
+    TidalModelFloat64: PerthFloat64,
+}
+
+#: Factors converting integer datetime64 values to microseconds
+_TO_MICROSECONDS = {"s": 1_000_000, "ms": 1_000, "us": 1}
+
+#: Integer representation of NaT
+_NAT = -(2**63)
+
+
+def _epoch_microseconds(time: VectorDateTime64) -> NDArray[numpy.int64]:
+    """Return the timestamps as microseconds since epoch.
+
+    The common units are converted with integer arithmetic on the raw
+    values, keeping NaT; the others fall back to a datetime64 cast.
+    """
+    import numpy  # noqa: PLC0415
+
+    if time.dtype.kind == "M":
+        unit, count = numpy.datetime_data(time.dtype)
+        if count == 1 and (unit == "ns" or unit in _TO_MICROSECONDS):
+            values = time.view("i8")
+            if unit == "us":
+                return values
+            if unit == "ns":
+                epoch = numpy.floor_divide(values, 1_000)
+            else:
+                epoch = numpy.multiply(values, _TO_MICROSECONDS[unit])
+            # NaT must stay NaT rather than becoming a valid timestamp
+            numpy.copyto(epoch, _NAT, where=values == _NAT)
+            return epoch
+    return time.astype("M8[us]").astype("i8")
+
+
+def __getattr__(name: str) -> Any:
+    """Import the model loader, and therefore NumPy and netCDF4, only when
+    it is first used."""
+    if name == "load_model":
+        from .model import load_model  # noqa: PLC0415
+
+        globals()[name] = load_model
+        return load_model
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class Perth:
     """A tidal analysis and prediction engine.
 
@@ -64,21 +116,25 @@ class Perth:
         model: TidalModelFloat32 | TidalModelFloat64,
         group_modulations: bool = False,
     ) -> None:
-        self._handler: PerthFloat32 | PerthFloat64
-        if isinstance(model, TidalModelFloat32):
-            self._handler = PerthFloat32(
-                model,
-                group_modulations,
-            )
-        elif isinstance(model, TidalModelFloat64):
-            self._handler = PerthFloat64(
-                model,
-                group_modulations,
+        handler = _HANDLERS.get(type(model))
+        if handler is None:
+            # Subclasses of the model types are not found by the exact lookup
+            handler = next(
+                (
+                    item
+                    for base, item in _HANDLERS.items()
+                    if isinstance(model, base)
+                ),
+                None,
             )
-        else:
+        if handler is None:
             raise TypeError(
                 "Model must be of type TidalModelFloat32 or TidalModelFloat64"
             )
+        self._handler: PerthFloat32 | PerthFloat64 = handler(
+            model,  # type: ignore[arg-type]
+            group_modulations,
+        )
 
     @property
     def tidal_model(self) -> TidalModelFloat32 | TidalModelFloat64:
@@ -131,7 +187,7 @@ class Perth:
               shape [m, 1]
         """
         # Convert datetime64 to microseconds since epoch
-        epoch = time.astype("M8[us]").astype("i8")
+        epoch = _epoch_microseconds(time)
         return self._handler.evaluate(
             lon,
             lat,
@@ -6,16 +6,20 @@ import numpy
 
 MatrixComplex64: TypeAlias = Annotated[NDArray[numpy.complex64], "[m, n]"]
 MatrixComplex128: TypeAlias = Annotated[NDArray[numpy.complex128], "[m, n]"]
+MatrixFloat32: TypeAlias = Annotated[NDArray[numpy.float32], "[m, n]"]
+MatrixFloat64: TypeAlias = Annotated[NDArray[numpy.float64], "[m, n]"]
 VectorFloat64: TypeAlias = Annotated[NDArray[numpy.float64], "[m, 1]"]
 VectorInt64: TypeAlias = Annotated[NDArray[numpy.int64], "[m, 1]"]
 VectorInt8: TypeAlias = Annotated[NDArray[numpy.int8], "[m, 1]"]
 Vector6Int8: TypeAlias = Annotated[NDArray[numpy.int8], "[6, 1]"]
+Matrix6Int8: TypeAlias = Annotated[NDArray[numpy.int8], "[m, 6]"]
 Vector7Int8: TypeAlias = Annotated[NDArray[numpy.int8], "[7, 1]"]
 
 def assemble_constituent_table(
     constituents: Sequence[Constituent] | None = None,
 ) -> ConstituentTable: ...
 def tidal_frequency(doodson_number: Vector6Int8) -> float: ...
+def tidal_frequencies(doodson_numbers: Matrix6Int8) -> VectorFloat64: ...
 def constituent_to_name(
     constituent: Constituent,
 ) -> str: ...
@@ -211,6 +215,15 @@ class TidalModelFloat32:
         constituent: Constituent,
         wave: MatrixComplex64,
     ) -> None: ...
+    def add_constituent_polar(
+        self,
+        constituent: Constituent,
+        amplitude: MatrixFloat32,
+        phase: MatrixFloat32,
+        amplitude_scale: float = 1.0,
+        phase_scale: float = 1.0,
+        num_threads: int = 0,
+    ) -> None: ...
     def empty(self) -> bool: ...
     def identifiers(self) -> list[Constituent]: ...
     def interpolate(
@@ -232,6 +245,15 @@ class TidalModelFloat64:
         constituent: Constituent,
         wave: MatrixComplex128,
     ) -> None: ...
+    def add_constituent_polar(
+        self,
+        constituent: Constituent,
+        amplitude: MatrixFloat64,
+        phase: MatrixFloat64,
+        amplitude_scale: float = 1.0,
+        phase_scale: float = 1.0,
+        num_threads: int = 0,
+    ) -> None: ...
     def empty(self) -> bool: ...
     def identifiers(self) -> list[Constituent]: ...
     def interpolate(
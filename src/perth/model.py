@@ -1,6 +1,5 @@
-from collections.abc import Callable
-import os
-from typing import NamedTuple
+import concurrent.futures
+import threading
 import netCDF4
 import numpy
 import dataclasses
@@ -8,35 +7,47 @@ import dataclasses
 
 from . import _core
 
+#: Serializes the calls to the netCDF library, which is not thread-safe
+_NETCDF_LOCK = threading.Lock()
+
 #: Conversion factors for metric units
 METRIC = {"m": 1.0, "km": 1000.0, "cm": 0.01, "mm": 0.001}
 
-#: Conversion functions for angular units
-ANGULAR: dict[str, Callable[[numpy.ndarray], numpy.ndarray]] = {
-    "rad": lambda x: x,
-    "deg": lambda x: numpy.radians(x),
-}
-
 
-def _convert_to_meters(values: numpy.ndarray, units: str) -> numpy.ndarray:
-    """Convert values to meters based on the specified units."""
+def _meters_scale(units: str) -> float:
+    """Return the factor converting values in the specified units to
+    meters."""
     if units not in METRIC:
         raise ValueError(f"Unknown units: {units}")
-    return values * METRIC[units]
+    return METRIC[units]
 
 
-def _convert_to_radians(values: numpy.ndarray, units: str) -> numpy.ndarray:
-    """Convert values to radians based on the specified units."""
-    if units.lower() in ["degree", "degrees", "deg"]:
-        units = "deg"
-    elif units.lower() in ["radian", "radians", "rad"]:
-        units = "rad"
-    if units not in ANGULAR:
-        raise ValueError(f"Unknown units: {units}")
-    return ANGULAR[units](values)
+def _normalize_angular_units(units: str) -> str:
+    """Return the canonical name, ``rad`` or ``deg``, of angular units."""
+    name = units.lower()
+    if name in ["degree", "degrees", "deg"]:
+        return "deg"
+    if name in ["radian", "radians", "rad"]:
+        return "rad"
+    raise ValueError(f"Unknown units: {units}")
+
+
+def _radians_scale(units: str) -> float:
+    """Return the factor converting values in the specified canonical
+    angular units to radians."""
+    return numpy.pi / 180.0 if units == "deg" else 1.0
+
+
+def _filled(values: numpy.ndarray) -> numpy.ndarray:
+    """Replace masked values with NaN, without copying the data when no value
+    is masked."""
+    if numpy.ma.is_masked(values):
+        return numpy.ma.filled(values, fill_value=numpy.nan)
+    return numpy.ma.getdata(values)
 
 
-class ModelMetadata(NamedTuple):
+@dataclasses.dataclass(frozen=True, slots=True)
+class ModelMetadata:
     """Metadata extracted from the first constituent dataset."""
 
     amplitude_units: str
@@ -60,11 +71,12 @@ class VariableNames:
 
 def _get_variable_unit(var: netCDF4.Variable) -> str:
     """Extract units from a netCDF variable."""
-    if not hasattr(var, "units"):
+    units = getattr(var, "units", None)
+    if units is None:
         raise ValueError(
             f"Variable {var.name} does not have a 'units' attribute."
         )
-    return var.units
+    return units
 
 
 def _validate_required_variables(
@@ -86,10 +98,10 @@ def _validate_required_variables(
             )
 
 
-def _validate_amplitude_phase_consistency(
+def _validate_amplitude_phase_shapes(
     amp: netCDF4.Variable, ph: netCDF4.Variable, constituent_name: str
 ) -> None:
-    """Validate that amplitude and phase variables have consistent shapes."""
+    """Validate that amplitude and phase variables have the same shape."""
     if amp.shape != ph.shape:
         raise RuntimeError(
             f"Amplitude and phase variables must have the same shape, "
@@ -99,7 +111,7 @@ def _validate_amplitude_phase_consistency(
 
 
 def _extract_initial_metadata(
-    dataset: netCDF4.Dataset, var_names: VariableNames
+    dataset: netCDF4.Dataset, var_names: VariableNames, constituent_name: str
 ) -> ModelMetadata:
     """Extract metadata from the first constituent dataset."""
     lon = dataset.variables[var_names.longitude]
@@ -107,9 +119,11 @@ def _extract_initial_metadata(
     amp = dataset.variables[var_names.amplitude]
     ph = dataset.variables[var_names.phase]
 
+    _validate_amplitude_phase_shapes(amp, ph, constituent_name)
+
     dtype = max(amp.dtype, ph.dtype)
     amp_units = _get_variable_unit(amp)
-    ph_units = _get_variable_unit(ph)
+    ph_units = _normalize_angular_units(_get_variable_unit(ph))
     row_major = amp.shape[0] == lon.shape[0]
 
     return ModelMetadata(
@@ -118,17 +132,35 @@ def _extract_initial_metadata(
         dtype=dtype,
         shape=amp.shape,
         row_major=row_major,
-        x_axis=lon[:],
-        y_axis=lat[:],
+        x_axis=_filled(lon[:]),
+        y_axis=_filled(lat[:]),
     )
 
 
+def _axes_equal(values: numpy.ndarray, reference: numpy.ndarray) -> bool:
+    """Check whether two coordinate arrays are identical.
+
+    The shapes and the bounds are compared first, so that most mismatches are
+    detected without scanning the arrays; the values are then compared
+    element-wise. As with numpy.array_equal, ``-0.0`` equals ``0.0`` and NaN
+    never compares equal.
+    """
+    if values.shape != reference.shape:
+        return False
+    if values.size and (
+        values.flat[0] != reference.flat[0]
+        or values.flat[-1] != reference.flat[-1]
+    ):
+        return False
+    return bool(numpy.array_equal(values, reference))
+
+
 def _validate_consistency_with_metadata(
     dataset: netCDF4.Dataset,
     var_names: VariableNames,
     metadata: ModelMetadata,
     constituent_name: str,
-) -> numpy.dtype:
+) -> None:
     """Validate that the current dataset is consistent with the reference
     metadata."""
     lon = dataset.variables[var_names.longitude]
@@ -137,14 +169,14 @@ def _validate_consistency_with_metadata(
     ph = dataset.variables[var_names.phase]
 
     # Check coordinate consistency
-    if not numpy.array_equal(lon[:], metadata.x_axis):
+    if not _axes_equal(_filled(lon[:]), metadata.x_axis):
         raise RuntimeError(
             f"Longitude variable must have the same values for all "
             f"constituents, but found different values for "
             f"constituent {constituent_name}."
         )
 
-    if not numpy.array_equal(lat[:], metadata.y_axis):
+    if not _axes_equal(_filled(lat[:]), metadata.y_axis):
         raise RuntimeError(
             f"Latitude variable must have the same values for all "
             f"constituents, but found different values for "
@@ -152,6 +184,7 @@ def _validate_consistency_with_metadata(
         )
 
     # Check shape consistency
+    _validate_amplitude_phase_shapes(amp, ph, constituent_name)
     if metadata.shape != amp.shape:
         raise RuntimeError(
             f"All constituents must have the same shape, "
@@ -171,25 +204,24 @@ def _validate_consistency_with_metadata(
         )
 
     # Check units consistency
-    if metadata.amplitude_units != _get_variable_unit(amp):
+    amp_units = _get_variable_unit(amp)
+    if metadata.amplitude_units != amp_units:
         raise RuntimeError(
             f"All amplitude variables must have the same units, "
-            f"but found {_get_variable_unit(amp)} for constituent "
+            f"but found {amp_units} for constituent "
             f"{constituent_name} and {metadata.amplitude_units} for previous "
             "constituents."
         )
 
-    if metadata.phase_units != _get_variable_unit(ph):
+    ph_units = _normalize_angular_units(_get_variable_unit(ph))
+    if metadata.phase_units != ph_units:
         raise RuntimeError(
             f"All phase variables must have the same units, "
-            f"but found {_get_variable_unit(ph)} for constituent "
+            f"but found {ph_units} for constituent "
             f"{constituent_name} and {metadata.phase_units} for previous "
             "constituents."
         )
 
-    # Return updated dtype (max of current and previous)
-    return max(metadata.dtype, amp.dtype, ph.dtype)
-
 
 def _create_axis(
     values: numpy.ndarray, epsilon: float, is_periodic: bool = False
@@ -198,9 +230,9 @@ def _create_axis(
     if values.dtype == numpy.float32:
         # For 32-bit floats, recalculate axis properties to avoid precision
         # loss when dealing with small grid step sizes
-        start = values[0].astype(numpy.float64)
-        end = values[-1].astype(numpy.float64)
-        step = (end - start) / (len(values) - 1)
+        start = float(values[0])
+        end = float(values[-1])
+        step = (end - start) / (values.size - 1)
         return _core.Axis(
             start,
             end,
@@ -217,16 +249,17 @@ def _create_axis(
 
 
 def _create_tidal_model(
-    metadata: ModelMetadata, dtype: numpy.dtype
+    metadata: ModelMetadata,
 ) -> _core.TidalModelFloat32 | _core.TidalModelFloat64:
     """Create the appropriate tidal model based on the data type."""
+    dtype = metadata.dtype
     x_axis = _create_axis(
-        numpy.ma.filled(metadata.x_axis, fill_value=numpy.nan),
+        metadata.x_axis,
         epsilon=1e-6,
         is_periodic=True,
     )
     y_axis = _create_axis(
-        numpy.ma.filled(metadata.y_axis, fill_value=numpy.nan),
+        metadata.y_axis,
         epsilon=1e-6,
     )
     if dtype == numpy.float32:
@@ -248,25 +281,82 @@ def _create_tidal_model(
         )
 
 
-def _process_constituent_data(
+def _set_chunk_cache(var: netCDF4.Variable) -> None:
+    """Size the chunk cache of a chunked variable to hold all its chunks, so
+    reading it whole decompresses each chunk only once."""
+    if var.chunking() in (None, "contiguous"):
+        return
+    size = int(numpy.prod(var.shape, dtype=numpy.int64)) * var.dtype.itemsize
+    var.set_var_chunk_cache(size=size, nelems=4001, preemption=0.75)
+
+
+def _read_variable(var: netCDF4.Variable, dtype: numpy.dtype) -> numpy.ndarray:
+    """Read a variable as an array of the given type, with masked values
+    replaced by NaN.
+
+    No copy is made when the variable is already stored with this type.
+    """
+    return numpy.asarray(_filled(var[:]), dtype=dtype)
+
+
+def _read_constituent_data(
     dataset: netCDF4.Dataset, var_names: VariableNames, metadata: ModelMetadata
-) -> numpy.ndarray:
-    """Process amplitude and phase data for a single constituent."""
-    amp_raw = numpy.ma.filled(
-        dataset.variables[var_names.amplitude][:],
-        fill_value=numpy.nan,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Read amplitude and phase data for a single constituent."""
+    _set_chunk_cache(dataset.variables[var_names.amplitude])
+    _set_chunk_cache(dataset.variables[var_names.phase])
+
+    amp = _read_variable(
+        dataset.variables[var_names.amplitude],
+        metadata.dtype,
     )
-    ph_raw = numpy.ma.filled(
-        dataset.variables[var_names.phase][:],
-        fill_value=numpy.nan,
+    ph = _read_variable(
+        dataset.variables[var_names.phase],
+        metadata.dtype,
     )
+    return amp, ph
 
-    # Apply unit conversions
-    amp = _convert_to_meters(amp_raw, metadata.amplitude_units)
-    ph = _convert_to_radians(ph_raw, metadata.phase_units)
 
-    # Convert to complex wave representation
-    return amp * numpy.cos(ph) + 1j * amp * numpy.sin(ph)
+def _open_dataset(constituent: _core.Constituent, path: str) -> netCDF4.Dataset:
+    """Open the dataset of a constituent for reading."""
+    try:
+        return netCDF4.Dataset(path, "r")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(
+            f"File for constituent {constituent.name} not found: {path}"
+        ) from e
+
+
+def _stored_dtype(
+    constituent: _core.Constituent, path: str, var_names: VariableNames
+) -> numpy.dtype:
+    """Return the widest type storing the amplitude and phase of a
+    constituent, read from the variable headers only."""
+    with _open_dataset(constituent, path) as dataset:
+        _validate_required_variables(dataset, var_names, constituent.name)
+        return max(
+            dataset.variables[var_names.amplitude].dtype,
+            dataset.variables[var_names.phase].dtype,
+        )
+
+
+def _load_constituent(
+    constituent: _core.Constituent,
+    path: str,
+    var_names: VariableNames,
+    metadata: ModelMetadata,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Load the amplitude and phase of a constituent, checking that its
+    dataset is consistent with the reference metadata."""
+    with _NETCDF_LOCK, _open_dataset(constituent, path) as dataset:
+        _validate_required_variables(dataset, var_names, constituent.name)
+        _validate_consistency_with_metadata(
+            dataset,
+            var_names,
+            metadata,
+            constituent.name,
+        )
+        return _read_constituent_data(dataset, var_names, metadata)
 
 
 def load_model(
@@ -288,7 +378,8 @@ def load_model(
         phase: Name of phase variable (default: 'phase')
 
     Returns:
-        Tidal model instance (Float32 or Float64 based on data precision)
+        Tidal model instance (Float32 or Float64 based on the widest data
+        precision of the constituents)
 
     Raises:
         ValueError: If no files provided or unsupported data type
@@ -304,64 +395,75 @@ def load_model(
         phase=phase or "phase",
     )
 
-    # First pass: validate datasets and extract metadata
-    metadata: ModelMetadata | None = None
-    dtype: numpy.dtype | None = None
-
-    for constituent, path in files.items():
-        if not os.path.exists(path):
-            raise FileNotFoundError(
-                f"File for constituent {constituent.name} not found: {path}"
-            )
-
-        with netCDF4.Dataset(path, "r") as dataset:
-            _validate_required_variables(
-                dataset,
-                var_names,
-                constituent.name,
-            )
-
-            amp = dataset.variables[var_names.amplitude]
-            ph = dataset.variables[var_names.phase]
-            _validate_amplitude_phase_consistency(
-                amp,
-                ph,
-                constituent.name,
-            )
-
-            if metadata is None:
-                metadata = _extract_initial_metadata(
-                    dataset,
-                    var_names,
-                )
-                dtype = metadata.dtype
-            else:
-                dtype = _validate_consistency_with_metadata(
-                    dataset,
+    # The first dataset provides the reference metadata.
+    (constituent, path), *others = files.items()
+    with _NETCDF_LOCK, _open_dataset(constituent, path) as dataset:
+        _validate_required_variables(dataset, var_names, constituent.name)
+        metadata = _extract_initial_metadata(
+            dataset,
+            var_names,
+            constituent.name,
+        )
+        # The model is stored with the widest type of all the constituents
+        dtype = max(
+            [
+                metadata.dtype,
+                *(
+                    _stored_dtype(item, item_path, var_names)
+                    for item, item_path in others
+                ),
+            ]
+        )
+        if dtype != metadata.dtype:
+            metadata = dataclasses.replace(metadata, dtype=dtype)
+        # The units and the data type are checked before any data is read.
+        # The unit conversions are applied by the model while it builds the
+        # complex waves from the amplitudes and phases.
+        amp_scale = _meters_scale(metadata.amplitude_units)
+        ph_scale = _radians_scale(metadata.phase_units)
+        model = _create_tidal_model(metadata)
+        amp, ph = _read_constituent_data(dataset, var_names, metadata)
+
+    model.add_constituent_polar(constituent, amp, ph, amp_scale, ph_scale)
+    del amp, ph
+
+    if not others:
+        return model
+
+    # The netCDF reads are serialized, so a single worker reads the next file
+    # while the model, which is not thread-safe, builds the current wave on
+    # this thread with the GIL released. Submitting the reads one at a time
+    # keeps at most one constituent waiting in memory.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        futures = (
+            (
+                constituent,
+                executor.submit(
+                    _load_constituent,
+                    constituent,
+                    path,
                     var_names,
                     metadata,
-                    constituent.name,
-                )
-
-    # At this point, metadata and dtype are guaranteed to be set
-    # (files is not empty)
-    assert metadata is not None
-    assert dtype is not None
-
-    # Create the tidal model
-    model = _create_tidal_model(
-        metadata,
-        dtype,
-    )
-
-    # Second pass: load and add constituent data
-    for constituent, path in files.items():
-        with netCDF4.Dataset(path, "r") as dataset:
-            wave = _process_constituent_data(
-                dataset,
-                var_names,
-                metadata,
+                ),
             )
-            model.add_constituent(constituent, wave)
+            for constituent, path in others
+        )
+        try:
+            pending = next(futures)
+            while pending is not None:
+                constituent, future = pending
+                amp, ph = future.result()
+                pending = next(futures, None)
+                model.add_constituent_polar(
+                    constituent,
+                    amp,
+                    ph,
+                    amp_scale,
+                    ph_scale,
+                )
+                del amp, ph
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
 
     return model
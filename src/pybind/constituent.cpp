@@ -244,6 +244,12 @@ auto instantiate_constituent(nanobind::module_ &m) -> void {
         nb::arg("doodson_number"),
         "Returns the tidal frequency in degrees per hour.");
 
+  m.def("tidal_frequencies", &perth::tidal_frequencies,
+        "Calculate the tidal frequencies in degrees per hour from Doodson "
+        "numbers stored one per row.",
+        nb::arg("doodson_numbers"),
+        "Returns the tidal frequencies in degrees per hour.");
+
   m.def(
       "assemble_constituent_table",
       [](const std::optional<std::vector<perth::Constituent>> &constituents) {
@@ -25,6 +25,14 @@ auto bind_tidal_model(nanobind::module_& m, const char* name) -> void {
       .def("add_constituent", &perth::TidalModel<T>::add_constituent,
            nb::arg("constituent"), nb::arg("wave"),
            "Add a tidal constituent with its corresponding wave data")
+      .def("add_constituent_polar",
+           &perth::TidalModel<T>::add_constituent_polar,
+           nb::arg("constituent"), nb::arg("amplitude"), nb::arg("phase"),
+           nb::arg("amplitude_scale") = T(1), nb::arg("phase_scale") = T(1),
+           nb::arg("num_threads") = 0,
+           "Add a tidal constituent from its amplitude and phase, scaled to "
+           "meters and radians by the given factors",
+           nb::call_guard<nb::gil_scoped_release>())
       .def(
           "interpolate",
           [](const perth::TidalModel<T>& self, const double lon,
@@ -2,6 +2,7 @@
 
 #include <gtest/gtest.h>
 #include "perth/eigen.hpp"
+#include "perth/tidal_frequency.hpp"
 
 namespace perth {
 
@@ -41,4 +42,18 @@ TEST(DoodsonTest, CalculateDoodsonArgument) {
   EXPECT_NEAR(result, 86.139014533657019, 1e-10);
 }
 
+TEST(DoodsonTest, TidalFrequencyBatch) {
+  // M2, K1 and Mf constituents
+  Eigen::Matrix<double, -1, 6, Eigen::RowMajor> doodson_numbers(3, 6);
+  doodson_numbers << 2, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0;
+
+  const Eigen::VectorXd result = tidal_frequencies(doodson_numbers);
+  ASSERT_EQ(result.size(), 3);
+  EXPECT_NEAR(result[0], 28.9841042, 1e-6);
+  for (Eigen::Index ix = 0; ix < doodson_numbers.rows(); ++ix) {
+    const Vector6d doodson_number = doodson_numbers.row(ix).transpose();
+    EXPECT_NEAR(result[ix], tidal_frequency(doodson_number), 1e-12);
+  }
+}
+
 }  // namespace perth
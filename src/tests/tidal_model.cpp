@@ -0,0 +1,70 @@
+#include "perth/tidal_model.hpp"
+
+#include <gtest/gtest.h>
+
+#include <complex>
+#include <limits>
+#include <numbers>
+#include <stdexcept>
+
+#include "perth/axis.hpp"
+#include "perth/constituent.hpp"
+
+namespace perth {
+
+using RowMatrixXf = Eigen::Matrix<float, -1, -1, Eigen::RowMajor>;
+using RowMatrixXcf =
+    Eigen::Matrix<std::complex<float>, -1, -1, Eigen::RowMajor>;
+
+TEST(TidalModelTest, AddConstituentPolar) {
+  auto lon = Axis(0.0, 350.0, 10.0, 1e-6, true);
+  auto lat = Axis(-90.0, 90.0, 10.0);
+
+  // Amplitude in centimeters and phase in degrees
+  RowMatrixXf amp = RowMatrixXf::Random(lon.size(), lat.size()).cwiseAbs();
+  RowMatrixXf ph = RowMatrixXf::Random(lon.size(), lat.size()) * 180.0F;
+  amp(3, 4) = std::numeric_limits<float>::quiet_NaN();
+
+  constexpr auto amp_scale = 0.01F;
+  constexpr auto ph_scale = static_cast<float>(std::numbers::pi / 180.0);
+
+  RowMatrixXcf wave(lon.size(), lat.size());
+  for (Eigen::Index ix = 0; ix < amp.rows(); ++ix) {
+    for (Eigen::Index jx = 0; jx < amp.cols(); ++jx) {
+      wave(ix, jx) = std::polar(amp_scale * amp(ix, jx), ph_scale * ph(ix, jx));
+    }
+  }
+
+  auto expected = TidalModel<float>(lon, lat);
+  expected.add_constituent(Constituent::kM2, wave);
+
+  auto model = TidalModel<float>(lon, lat);
+  model.add_constituent_polar(Constituent::kM2, amp, ph, amp_scale, ph_scale,
+                              2);
+  EXPECT_EQ(model.size(), 1);
+
+  auto table = assemble_constituent_table(model.identifiers());
+  auto expected_table = assemble_constituent_table(model.identifiers());
+  for (const auto& [x, y] : {std::pair{15.0, 5.0}, std::pair{123.0, -47.0},
+                             std::pair{345.0, 85.0}, std::pair{35.0, -55.0}}) {
+    auto acc = model.accelerator(0);
+    auto expected_acc = expected.accelerator(0);
+    EXPECT_EQ(model.interpolate(x, y, table, acc.get()),
+              expected.interpolate(x, y, expected_table, expected_acc.get()));
+    EXPECT_NEAR(table[Constituent::kM2].tide.real(),
+                expected_table[Constituent::kM2].tide.real(), 1e-6);
+    EXPECT_NEAR(table[Constituent::kM2].tide.imag(),
+                expected_table[Constituent::kM2].tide.imag(), 1e-6);
+  }
+
+  // Amplitude and phase must have the same shape.
+  EXPECT_THROW(model.add_constituent_polar(Constituent::kS2, amp,
+                                           ph.leftCols(2), amp_scale, ph_scale),
+               std::invalid_argument);
+  // The grid must match the axes.
+  EXPECT_THROW(model.add_constituent_polar(Constituent::kS2, amp.transpose(),
+                                           ph.transpose(), amp_scale, ph_scale),
+               std::invalid_argument);
+}
+
+}  // namespace perth
@@ -0,0 +1,23 @@
+import numpy
+import pytest
+
+from perth import _epoch_microseconds
+
+
+@pytest.mark.parametrize("unit", ["ns", "us", "ms", "s"])
+def test_epoch_microseconds(unit: str):
+    time = numpy.array(
+        [
+            "1900-01-01T00:00:00.000001999",
+            "1969-12-31T23:59:59.999999999",
+            "NaT",
+            "1970-01-01T00:00:00",
+            "2024-02-29T12:34:56.789012345",
+        ],
+        dtype="datetime64[ns]",
+    ).astype(f"datetime64[{unit}]")
+    expected = time.astype("datetime64[us]").astype("int64")
+    epoch = _epoch_microseconds(time)
+    assert epoch.dtype == numpy.int64
+    numpy.testing.assert_array_equal(epoch, expected)
+    assert epoch[2] == numpy.iinfo(numpy.int64).min
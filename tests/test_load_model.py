@@ -0,0 +1,104 @@
+import pathlib
+
+import netCDF4
+import numpy
+import pytest
+import perth
+from perth.model import _axes_equal
+
+
+def write_constituent(
+    path: pathlib.Path,
+    *,
+    dtype: str = "f4",
+    phase_units: str = "degrees",
+    phase_dimensions: tuple[str, str] = ("lat", "lon"),
+    longitude: float = 0.0,
+) -> str:
+    """Write a tiny constituent dataset on a 3x4 grid."""
+    with netCDF4.Dataset(path, "w") as dataset:
+        dataset.createDimension("lat", 3)
+        dataset.createDimension("lon", 4)
+        lat = dataset.createVariable("latitude", "f8", ("lat",))
+        lat[:] = [-45.0, 0.0, 45.0]
+        lon = dataset.createVariable("longitude", "f8", ("lon",))
+        lon[:] = longitude + numpy.arange(4) * 90.0
+        amp = dataset.createVariable("amplitude", dtype, ("lat", "lon"))
+        amp.units = "cm"
+        amp[:] = numpy.full((3, 4), 10.0)
+        ph = dataset.createVariable("phase", dtype, phase_dimensions)
+        ph.units = phase_units
+        ph[:] = numpy.zeros(ph.shape)
+    return str(path)
+
+
+def test_load_model_phase_units(tmp_path: pathlib.Path):
+    files = {
+        perth.Constituent.M2: write_constituent(
+            tmp_path / "m2.nc", phase_units="deg"
+        ),
+        perth.Constituent.S2: write_constituent(
+            tmp_path / "s2.nc", phase_units="degrees"
+        ),
+    }
+    model = perth.load_model(files)
+    assert isinstance(model, perth.TidalModelFloat32)
+    assert set(model.identifiers()) == set(files)
+
+
+@pytest.mark.parametrize("dtypes", [("f4", "f8"), ("f8", "f4")])
+def test_load_model_mixed_precision(
+    tmp_path: pathlib.Path, dtypes: tuple[str, str]
+):
+    files = {
+        perth.Constituent.M2: write_constituent(
+            tmp_path / "m2.nc", dtype=dtypes[0]
+        ),
+        perth.Constituent.S2: write_constituent(
+            tmp_path / "s2.nc", dtype=dtypes[1]
+        ),
+    }
+    model = perth.load_model(files)
+    assert isinstance(model, perth.TidalModelFloat64)
+    assert set(model.identifiers()) == set(files)
+
+
+def test_load_model_missing_file(tmp_path: pathlib.Path):
+    files = {
+        perth.Constituent.M2: write_constituent(tmp_path / "m2.nc"),
+        perth.Constituent.S2: str(tmp_path / "s2.nc"),
+    }
+    with pytest.raises(FileNotFoundError, match="constituent S2 not found"):
+        perth.load_model(files)
+
+
+def test_load_model_amplitude_phase_shapes(tmp_path: pathlib.Path):
+    files = {
+        perth.Constituent.M2: write_constituent(
+            tmp_path / "m2.nc", phase_dimensions=("lon", "lat")
+        ),
+    }
+    with pytest.raises(RuntimeError, match="must have the same shape"):
+        perth.load_model(files)
+
+
+def test_load_model_coordinates(tmp_path: pathlib.Path):
+    files = {
+        perth.Constituent.M2: write_constituent(tmp_path / "m2.nc"),
+        perth.Constituent.S2: write_constituent(
+            tmp_path / "s2.nc", longitude=1.0
+        ),
+    }
+    with pytest.raises(RuntimeError, match="Longitude variable"):
+        perth.load_model(files)
+
+
+def test_axes_equal():
+    axis = numpy.array([0.0, 1.0, 2.0])
+    assert _axes_equal(axis.copy(), axis)
+    assert _axes_equal(numpy.array([-0.0, 1.0, 2.0]), axis)
+    assert _axes_equal(axis.astype("f4"), axis)
+    assert not _axes_equal(numpy.array([0.0, 1.5, 2.0]), axis)
+    assert not _axes_equal(axis[:2], axis)
+    nan = numpy.array([0.0, numpy.nan, 2.0])
+    assert not _axes_equal(nan.copy(), nan)